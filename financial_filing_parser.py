@@ -1,17 +1,62 @@
 import pandas as pd 
-from bs4 import BeautifulSoup
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import soupparser
 import os 
 import re
 
+# Precompiled patterns used in the per-cell / per-row hot paths
+_NUM_RE = re.compile(r'([\d\.]+)')
+_PAREN_NUM_RE = re.compile(r'\(([\d\.]+)\)')
+_DECIMAL_RE = re.compile(r'([\d]+\.[\d]+)')
+_INT_RE = re.compile(r'\b(\d+)\b')
+
+# All EPS patterns fused into one alternation so each row is scanned once.
+# The row-text patterns below are only matched against lowercased text, so
+# they are compiled without re.IGNORECASE.
+_EPS_RE = re.compile('(?:' + ')|(?:'.join([
+    r'(?:basic|diluted)?\s*earnings\s*(?:\(loss\))?\s*per\s*(?:common|outstanding|ordinary)?\s*share',
+    r'(?:basic|diluted)?\s*loss\s*per\s*(?:common|outstanding|ordinary)?\s*share',
+    r'earnings\s*\(loss\)\s*per\s*(?:common|outstanding|ordinary)?\s*share',
+    r'net\s*(?:income|loss|earnings)\s*(?:attributable\s*to\s*[a-z\s]+)?\s*per\s*share',
+    r'income\s*\(loss\)\s*per\s*share',
+    r'\beps\b',
+    r'earnings\s*per\s*share',
+    r'net\s+income\s+available\s+to\s+common\s+stockholders\s+per\s+share',
+    r'net\s+income\s+per\s+common\s+share',
+    r'net\s*(?:\(loss\)\s*income|income\s*\(loss\))\s*per\s*share',
+]) + ')')
+_EXCLUDE_RE = re.compile(r'weighted|average|shares\s*outstanding')
+_SHARES_OUTSTANDING_RE = re.compile(r'shares\s*outstanding')
+
+_BASIC_RE = re.compile(r'\bbasic\b')
+_DILUTED_RE = re.compile(r'\bdiluted\b')
+_BASIC_AND_DILUTED_RE = re.compile(r'basic\s+(?:and|&)\s+diluted')
+_DILUTED_AND_BASIC_RE = re.compile(r'diluted\s+(?:and|&)\s+basic')
+_NONGAAP_RE = re.compile(r'non-gaap|non\s*gaap')
+
+# Dash characters used as a leading minus sign
+_DASHES = ('-', '−', '–')
+
+# How many rows below an EPS label to search for its values
+_MAX_LOOKAHEAD_ROWS = 3
+
+@lru_cache(maxsize=8192)
 def extract_numeric_value(text):
     """
     Extract and normalize a numeric value, handling negative numbers in various formats.
+    Prioritizes decimal numbers over likely footnote references (small integers).
+    Results are memoized, since financial tables repeat the same cell strings
+    ('$', ')', dashes, recurring figures) many times.
     
     Args:
         text: Text containing a potential numeric value
         
     Returns:
-        Normalized numeric value as a string, or None if no valid number found
+        Numeric value as a float, or None if no valid number found
     """
     if not text:
         return None
@@ -19,36 +64,87 @@ def extract_numeric_value(text):
     # Clean the text
     cleaned_text = text.replace('$', '').replace(',', '').strip()
     
+    number, negative = _find_number(cleaned_text)
+    if number is None:
+        return None
+    
+    try:
+        value = float(number)
+    except ValueError:
+        # Stray decimal points such as '.' are not numbers
+        return None
+    # Keep '(0.00)' as plain zero rather than -0.0
+    return -value if negative and value else value
+
+def _find_number(cleaned_text):
+    """
+    Locate the numeric token in cleaned cell text and whether it is negative.
+    
+    Args:
+        cleaned_text: Cell text with '$' and ',' removed
+        
+    Returns:
+        Tuple of (number string or None, is_negative)
+    """
+    # Every branch below needs a digit or decimal point, so cells without one
+    # (labels, currency symbols, stray parentheses) stop after a single scan
+    num_match = _NUM_RE.search(cleaned_text)
+    if not num_match:
+        return None, False
+    
+    # First try to find decimal numbers (more likely to be actual values)
+    decimal_match = _DECIMAL_RE.search(cleaned_text)
+    if decimal_match:
+        # Found a number with decimal places - likely the real value
+        
+        # Check if it's in parentheses (negative)
+        if (f"({decimal_match.group(1)})" in cleaned_text or 
+            f"( {decimal_match.group(1)} )" in cleaned_text):
+            return decimal_match.group(1), True
+            
+        # Check for explicit negative signs (the text is already stripped)
+        if cleaned_text.startswith(_DASHES):
+            return decimal_match.group(1), True
+            
+        # Check for opening parenthesis without closing (split across cells)
+        if cleaned_text.startswith('(') and not cleaned_text.endswith(')'):
+            return decimal_match.group(1), True
+            
+        return decimal_match.group(1), False
+    
     # Handle case where opening parenthesis is present but closing one is missing
-    # This happens when parentheses are split across cells
     if cleaned_text.startswith('(') and not cleaned_text.endswith(')'):
-        match = re.search(r'\(?([\d\.]+)', cleaned_text)
-        if match:
-            return f"-{match.group(1)}"
+        return num_match.group(1), True
     
     # Handle normal parentheses case
     if '(' in cleaned_text and ')' in cleaned_text:
         # Extract the number inside parentheses
-        match = re.search(r'\(([\d\.]+)\)', cleaned_text)
+        match = _PAREN_NUM_RE.search(cleaned_text)
         if match:
-            return f"-{match.group(1)}"
+            return match.group(1), True
     
     # Handle numbers with explicit negative signs
-    if re.search(r'^\s*[\-−–]', cleaned_text):  # Handle various dash characters
-        match = re.search(r'([\d\.]+)', cleaned_text)
-        if match:
-            return f"-{match.group(1)}"
+    if cleaned_text.startswith(_DASHES):
+        return num_match.group(1), True
     
-    # Special case for closing parenthesis only - ignore it
-    if cleaned_text == ')':
-        return None
-    
-    # Normal number extraction
-    match = re.search(r'([\d\.]+)', cleaned_text)
-    if match:
-        return match.group(1)
+    # Look for integers, but filter out likely footnote references
+    int_matches = _INT_RE.findall(cleaned_text)
+    if int_matches:
+        # Filter out small integers that are likely footnotes
+        valid_ints = [n for n in int_matches if len(n) > 2 or int(n) > 20]
+        if valid_ints:
+            # Return the first valid integer
+            return valid_ints[0], False
+        
+        # If only small integers found, return the largest one as a fallback
+        # (Less likely to be a footnote reference)
+        if int_matches:
+            largest = max(int_matches, key=lambda x: int(x))
+            # Only return if it's part of a longer text (not standalone footnote)
+            if len(cleaned_text) > len(largest) + 3:
+                return largest, False
     
-    return None
+    return None, False
 
 def check_eps_pattern(text):
     """
@@ -60,30 +156,23 @@ def check_eps_pattern(text):
     Returns:
         Boolean indicating if an EPS pattern was found
     """
-    text = text.lower().strip()
-    patterns = [
-        r'(?:basic|diluted)?\s*earnings\s*(?:\(loss\))?\s*per\s*(?:common|outstanding|ordinary)?\s*share',
-        r'(?:basic|diluted)?\s*loss\s*per\s*(?:common|outstanding|ordinary)?\s*share',
-        r'earnings\s*\(loss\)\s*per\s*(?:common|outstanding|ordinary)?\s*share',
-        r'net\s*(?:income|loss|earnings)\s*(?:attributable\s*to\s*[a-z\s]+)?\s*per\s*share',
-        r'income\s*\(loss\)\s*per\s*share',
-        r'\beps\b',
-        r'earnings\s*per\s*share',
-        r'net\s+income\s+available\s+to\s+common\s+stockholders\s+per\s+share',
-        r'net\s+income\s+per\s+common\s+share',
-        r'net\s*(?:\(loss\)\s*income|income\s*\(loss\))\s*per\s*share',
-        
+    return check_eps_pattern_lower(text.lower().strip())
 
-    ]
-    
-    for pattern in patterns:
-        if re.search(pattern, text, re.IGNORECASE):
-            # Exclude weighted average share patterns
-            if re.search(r'weighted|average|shares\s*outstanding', text, re.IGNORECASE):
-                continue
-            return True
+def check_eps_pattern_lower(text):
+    """
+    Same as check_eps_pattern, for text that is already lowercased and stripped.
     
-    return False
+    Args:
+        text: Lowercased text to check for EPS patterns
+        
+    Returns:
+        Boolean indicating if an EPS pattern was found
+    """
+    # Every EPS pattern contains "share" or "eps", so skip the regex otherwise
+    if 'share' not in text and 'eps' not in text:
+        return False
+    # Exclude weighted average share patterns
+    return bool(_EPS_RE.search(text)) and not _EXCLUDE_RE.search(text)
 
 def is_basic_eps(text):
     """
@@ -96,18 +185,33 @@ def is_basic_eps(text):
         Tuple of (is_basic, is_diluted) booleans
     """
     try:
-        text = text.lower()
-        has_basic = bool(re.search(r'\bbasic\b', text))
-        has_diluted = bool(re.search(r'\bdiluted\b', text))
-                # Special case: "basic and diluted" or "basic & diluted" should count as both
-        if re.search(r'basic\s+(?:and|&)\s+diluted', text) or re.search(r'diluted\s+(?:and|&)\s+basic', text):
-            has_basic = True
-            has_diluted = True
-        return has_basic, has_diluted
+        return is_basic_eps_lower(text.lower())
     except Exception as e:
         print(f"Error in is_basic_eps: {e}")
         return False, False
 
+def is_basic_eps_lower(text):
+    """
+    Same as is_basic_eps, for text that is already lowercased.
+    
+    Args:
+        text: Lowercased text to check for basic/diluted indicators
+        
+    Returns:
+        Tuple of (is_basic, is_diluted) booleans
+    """
+    # Substring tests skip the regexes for rows that never mention the words
+    mentions_basic = 'basic' in text
+    mentions_diluted = 'diluted' in text
+    has_basic = mentions_basic and bool(_BASIC_RE.search(text))
+    has_diluted = mentions_diluted and bool(_DILUTED_RE.search(text))
+    # Special case: "basic and diluted" or "basic & diluted" should count as both
+    if (mentions_basic and mentions_diluted and not (has_basic and has_diluted)
+            and (_BASIC_AND_DILUTED_RE.search(text) or _DILUTED_AND_BASIC_RE.search(text))):
+        has_basic = True
+        has_diluted = True
+    return has_basic, has_diluted
+
 def is_gaap_eps(text):
     """
     Check if text refers to GAAP (not non-GAAP/adjusted) EPS.
@@ -118,15 +222,42 @@ def is_gaap_eps(text):
     Returns:
         Boolean indicating if EPS is GAAP (True) or non-GAAP (False)
     """
-    text = text.lower()
-    return not re.search(r'non-gaap|non\s*gaap|adjusted', text)
+    return is_gaap_eps_lower(text.lower())
+
+def is_gaap_eps_lower(text):
+    """
+    Same as is_gaap_eps, for text that is already lowercased.
+    
+    Args:
+        text: Lowercased text to check for GAAP/non-GAAP indicators
+        
+    Returns:
+        Boolean indicating if EPS is GAAP (True) or non-GAAP (False)
+    """
+    if 'adjusted' in text:
+        return False
+    # Every non-GAAP spelling contains "gaap"
+    return 'gaap' not in text or not _NONGAAP_RE.search(text)
+
+class RowValue:
+    """
+    A numeric value found in an EPS row together with its classification.
+    Uses __slots__ since one is created for every value cell in an EPS row.
+    """
+    __slots__ = ('value', 'basic', 'diluted', 'gaap')
+    
+    def __init__(self, value, basic, diluted, gaap):
+        self.value = value
+        self.basic = basic
+        self.diluted = diluted
+        self.gaap = gaap
 
 def select_eps_value(row_values, row_text, table_idx):
     """
     Select the appropriate EPS value based on priority rules and create the final EPS entry.
     
     Args:
-        row_values: List of dictionaries containing EPS values and classifications
+        row_values: List of RowValue objects containing EPS values and classifications
         row_text: Text from the row where EPS pattern was found
         table_idx: Table index for reference
         
@@ -140,232 +271,259 @@ def select_eps_value(row_values, row_text, table_idx):
     selected_entry = row_values[0]
     
     # First try to find basic EPS (highest priority)
-    basic_values = [item for item in row_values if item['basic']]
+    basic_values = [item for item in row_values if item.basic]
     if basic_values:
         selected_entry = basic_values[0]
     else:
         # If no basic found, try diluted
-        diluted_values = [item for item in row_values if item['diluted']]
+        diluted_values = [item for item in row_values if item.diluted]
         if diluted_values:
             selected_entry = diluted_values[0]
     
     # Extract just the values for cleaner output
-    value_list = [item['value'] for item in row_values]
+    value_list = [item.value for item in row_values]
     
     # Create the final EPS entry
     return {
         'table_idx': table_idx,
         'row_text': row_text[:100],  # Truncate for readability
-        'basic': selected_entry['basic'],
-        'diluted': selected_entry['diluted'],
-        'gaap': selected_entry['gaap'],
-        'value': selected_entry['value'],  # Prioritized value
+        'basic': selected_entry.basic,
+        'diluted': selected_entry.diluted,
+        'gaap': selected_entry.gaap,
+        'value': selected_entry.value,  # Prioritized value
         'all_values': value_list
     }
 
-def extract_eps_from_filing(file_path, verbose=False):
+def _iter_tables(file_path):
     """
-    Extract EPS values from an HTML financial filing.
+    Stream the <table> elements of an HTML filing in document order.
+    Each top-level table is discarded, together with everything before it,
+    once it has been consumed, so memory use does not grow with the file size.
     
     Args:
         file_path: Path to the HTML filing
+        
+    Returns:
+        Generator of lxml table elements
+    """
+    context = etree.iterparse(file_path, events=('end',), tag='table',
+                              html=True, recover=True, encoding='utf-8')
+    context.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+    
+    for _, table in context:
+        # Nested tables are yielded together with their outermost table
+        if next(table.iterancestors('table'), None) is not None:
+            continue
+        
+        yield from table.iter('table')
+        
+        # Free the processed table and any preceding content
+        table.clear()
+        for element in (table, *table.iterancestors()):
+            parent = element.getparent()
+            while parent is not None and element.getprevious() is not None:
+                del parent[0]
+
+def extract_eps_from_table(table, table_idx, verbose=False):
+    """
+    Extract EPS values from a single HTML table.
+    
+    Args:
+        table: lxml element for the <table>
+        table_idx: Table index for reference
         verbose: Whether to print detailed information during extraction
         
     Returns:
         List of dictionaries containing extracted EPS information
     """
-    if verbose:
-        print(f"Processing file: {file_path}")
-    
-    # Initialize the results list
     eps_values = []
     
-    with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-        html = f.read()
+    # Most tables never mention EPS. Every EPS row contains "share" or "eps"
+    # (see check_eps_pattern_lower), so one scan of the table text is enough
+    # to skip them. Colons are dropped the same way as for row text.
+    table_text = table.text_content().lower().replace(':', '')
+    if 'share' not in table_text and 'eps' not in table_text:
+        return eps_values
+    
+    # Get all rows for sequential access
+    rows = list(table.iter('tr'))
     
-    soup = BeautifulSoup(html, 'html.parser')
-    tables = soup.find_all('table')
+    # Row text is needed for every row and again when looking ahead for
+    # values, so extract it once per row
+    row_texts = [row.text_content().lower().strip().replace(':', '') for row in rows]
     
-    for table_idx, table in enumerate(tables):
-        # Get all rows for sequential access
-        rows = table.find_all('tr')
+    for i, row in enumerate(rows):
+        row_text = row_texts[i]
         
-        for i, row in enumerate(rows):
-            row_text = row.get_text().lower().strip().replace(':', '')
+        if check_eps_pattern_lower(row_text):
+            if verbose:
+                print(f"Found EPS pattern in row: {row_text[:100]}...")
             
-            if check_eps_pattern(row_text):
-                # Look for cells containing a value in current row
-                cells = row.find_all('td')
-                if verbose:
-                    print(f"Found EPS pattern in row: {row_text[:100]}...")
-                
-                # Get basic/diluted classification
-                basic, diluted = is_basic_eps(row_text)
+            # Get basic/diluted classification
+            basic, diluted = is_basic_eps_lower(row_text)
+            
+            # Get GAAP classification
+            gaap = is_gaap_eps_lower(row_text)
+            
+            # Check if this row has values
+            found_value = False
+            row_values = []
+            
+            # Look for cells containing a value in current row; cells are
+            # walked lazily rather than materialized into a list
+            for cell in row.iter('td'):
+                cell_text = cell.text_content().strip()
                 
-                # Get GAAP classification
-                gaap = is_gaap_eps(row_text)
+                value = extract_numeric_value(cell_text)
+
+                if value is not None:
+                    found_value = True
+                    
+                    row_values.append(RowValue(value, basic, diluted, gaap))
+                    
+                    if verbose:
+                        print(f"Found value in current row: {value}")
+            
+            # If no values found in current row or we suspect partial parentheses, check the next
+            # rows (EPS values are never more than a row or two below the label)
+            j = i + 1
+            while not found_value and j < len(rows) and j <= i + _MAX_LOOKAHEAD_ROWS:
+                next_row = rows[j]
+                next_row_text = row_texts[j]
                 
-                # Check if this row has values
-                found_value = False
-                row_values = []
+                # Get classifications from next row
+                if not(basic and diluted):
+                    basic, diluted = is_basic_eps_lower(next_row_text)
+                gaap = is_gaap_eps_lower(next_row_text)
                 
-                for cell in cells:
-                    cell_text = cell.get_text().strip()
-                    
+                if verbose:
+                    print(f"Checking next row for values...")
+                    print(next_row_text)
+                for cell in next_row.iter('td'):
+                    cell_text = cell.text_content().strip()
                     value = extract_numeric_value(cell_text)
-    
+                    
                     if value is not None:
                         found_value = True
-                        
-                        row_values.append({
-                            'value': value,
-                            'basic': basic,
-                            'diluted': diluted,
-                            'gaap': gaap
-                        })
+                        row_values.append(RowValue(value, basic, diluted, gaap))
                         
                         if verbose:
-                            print(f"Found value in current row: {value}")
-                
-                # If no values found in current row or we suspect partial parentheses, check the next row
-                while (not found_value and i + 1 < len(rows)):
-                    next_row = rows[i + 1]
-                    next_cells = next_row.find_all('td')
-                    next_row_text = next_row.get_text().lower().strip().replace(':', '')
-                    
-                    # Get classifications from next row
-                    if not(basic and diluted):
-                        basic, diluted = is_basic_eps(next_row_text)
-                    gaap = is_gaap_eps(next_row_text)
-                    
-                    if verbose:
-                        print(f"Checking next row for values...")
-                        print(next_row_text)
-                    for cell in next_cells:
-                        cell_text = cell.get_text().strip()
-                        value = extract_numeric_value(cell_text)
-                        
-                        if value is not None:
-                            found_value = True
-                            row_values.append({
-                                'value': value,
-                                'basic': basic,
-                                'diluted': diluted,
-                                'gaap': gaap
-                            })
-                            
-                            if verbose:
-                                print(f"Found value in next row: {value}")
-                    i+=1
-                # If we found at least one value, use helper method to select and create entry
-                if row_values:
-                    eps_entry = select_eps_value(row_values, row_text, table_idx)
-                    eps_values.append(eps_entry)
-    
+                            print(f"Found value in next row: {value}")
+                j += 1
+            # If we found at least one value, use helper method to select and create entry
+            if row_values:
+                eps_entry = select_eps_value(row_values, row_text, table_idx)
+                eps_values.append(eps_entry)
+
     return eps_values
 
-def process_directory(directory_path, verbose=False):
+def extract_eps_from_filing(file_path, verbose=False):
     """
-    Process all HTML files in a directory to extract EPS values.
+    Extract EPS values from an HTML financial filing.
     
     Args:
-        directory_path: Path to directory containing HTML filings
+        file_path: Path to the HTML filing
         verbose: Whether to print detailed information during extraction
         
     Returns:
-        DataFrame containing all extracted EPS information
+        List of dictionaries containing extracted EPS information
     """
-    all_results = []
+    if verbose:
+        print(f"Processing file: {file_path}")
     
-    for filename in os.listdir(directory_path):
-        if filename.endswith('.html'):
-            file_path = os.path.join(directory_path, filename)
-            results = extract_eps_from_filing(file_path, verbose=verbose)
-            value = select_final_eps(results)
-
-            all_results.append({ "filename": filename,"eps": value})
+    # Initialize the results list
+    eps_values = []
     
-    # Convert to DataFrame for easier analysis
-    df = pd.DataFrame(all_results)
-    return df
-def extract_numeric_value(text):
+    try:
+        for table_idx, table in enumerate(_iter_tables(file_path)):
+            eps_values.extend(extract_eps_from_table(table, table_idx, verbose=verbose))
+    except etree.XMLSyntaxError:
+        # Fall back to BeautifulSoup for documents lxml refuses to parse,
+        # using its pure-Python html.parser backend rather than libxml2
+        with open(file_path, 'rb') as f:
+            html = f.read().decode('utf-8', errors='replace')
+        tree = soupparser.fromstring(html, features='html.parser')
+        
+        eps_values = []
+        for table_idx, table in enumerate(tree.iter('table')):
+            eps_values.extend(extract_eps_from_table(table, table_idx, verbose=verbose))
+    
+    return eps_values
+
+def _format_eps(value):
     """
-    Extract and normalize a numeric value, handling negative numbers in various formats.
-    Prioritizes decimal numbers over likely footnote references (small integers).
+    Format a final EPS value for output.
     
     Args:
-        text: Text containing a potential numeric value
+        value: EPS value as a float, or None
         
     Returns:
-        Normalized numeric value as a string, or None if no valid number found
+        Shortest decimal string for the value, or None if there is no value
     """
-    if not text:
+    if value is None:
         return None
-        
-    # Clean the text
-    cleaned_text = text.replace('$', '').replace(',', '').strip()
+    # 'g' drops trailing zeros; 15 significant digits keep large values
+    # such as share counts out of exponent notation. Adding 0.0 turns a
+    # rounded-away negative sum (-0.0) into 0.
+    return f"{value + 0.0:.15g}"
+
+def _process_one(file_path, verbose=False):
+    """
+    Extract the final EPS value for a single filing.
+    Defined at module level so it can be pickled for worker processes.
     
-    # First try to find decimal numbers (more likely to be actual values)
-    decimal_match = re.search(r'([\d]+\.[\d]+)', cleaned_text)
-    if decimal_match:
-        # Found a number with decimal places - likely the real value
+    Args:
+        file_path: Path to the HTML filing
+        verbose: Whether to print detailed information during extraction
         
-        # Check if it's in parentheses (negative)
-        if (f"({decimal_match.group(1)})" in cleaned_text or 
-            f"( {decimal_match.group(1)} )" in cleaned_text):
-            return f"-{decimal_match.group(1)}"
-            
-        # Check for explicit negative signs
-        if re.search(r'^\s*[\-−–]', cleaned_text):
-            return f"-{decimal_match.group(1)}"
-            
-        # Check for opening parenthesis without closing (split across cells)
-        if cleaned_text.startswith('(') and not cleaned_text.endswith(')'):
-            return f"-{decimal_match.group(1)}"
-            
-        return decimal_match.group(1)
+    Returns:
+        Tuple of (filename, eps value)
+    """
+    results = extract_eps_from_filing(file_path, verbose=verbose)
+    return os.path.basename(file_path), select_final_eps(results)
+
+def process_directory(directory_path, verbose=False, max_workers=None):
+    """
+    Process all HTML files in a directory to extract EPS values.
+    Filings are independent, so they are processed in parallel worker processes.
+    Callers using the pool must invoke this under an `if __name__ == "__main__":`
+    guard on platforms that spawn workers (macOS, Windows).
     
-    # Handle case where opening parenthesis is present but closing one is missing
-    if cleaned_text.startswith('(') and not cleaned_text.endswith(')'):
-        match = re.search(r'\(?([\d\.]+)', cleaned_text)
-        if match:
-            return f"-{match.group(1)}"
+    Args:
+        directory_path: Path to directory containing HTML filings
+        verbose: Whether to print detailed information during extraction
+        max_workers: Number of worker processes (defaults to the CPU count);
+            when this resolves to 1, or there is only one filing, the
+            filings are processed serially without starting a pool
+        
+    Returns:
+        DataFrame containing all extracted EPS information
+    """
+    paths = [
+        os.path.join(directory_path, filename)
+        for filename in os.listdir(directory_path)
+        if filename.endswith('.html')
+    ]
     
-    # Handle normal parentheses case
-    if '(' in cleaned_text and ')' in cleaned_text:
-        # Extract the number inside parentheses
-        match = re.search(r'\(([\d\.]+)\)', cleaned_text)
-        if match:
-            return f"-{match.group(1)}"
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
     
-    # Handle numbers with explicit negative signs
-    if re.search(r'^\s*[\-−–]', cleaned_text):  # Handle various dash characters
-        match = re.search(r'([\d\.]+)', cleaned_text)
-        if match:
-            return f"-{match.group(1)}"
+    if workers <= 1:
+        # Not worth starting worker processes
+        all_results = [_process_one(path, verbose) for path in paths]
+    else:
+        # Each filing is a large task, so hand them out a few at a time
+        # to keep every worker busy
+        chunksize = max(1, len(paths) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            all_results = list(executor.map(_process_one, paths, repeat(verbose), chunksize=chunksize))
     
-    # Special case for closing parenthesis only - ignore it
-    if cleaned_text == ')':
-        return None
+    # Values stay floats during extraction and are only formatted here
+    all_results = [(filename, _format_eps(value)) for filename, value in all_results]
     
-    # Look for integers, but filter out likely footnote references
-    int_matches = re.findall(r'\b(\d+)\b', cleaned_text)
-    if int_matches:
-        # Filter out small integers that are likely footnotes
-        valid_ints = [n for n in int_matches if len(n) > 2 or int(n) > 20]
-        if valid_ints:
-            # Return the first valid integer
-            return valid_ints[0]
-        
-        # If only small integers found, return the largest one as a fallback
-        # (Less likely to be a footnote reference)
-        if int_matches:
-            largest = max(int_matches, key=lambda x: int(x))
-            # Only return if it's part of a longer text (not standalone footnote)
-            if len(cleaned_text) > len(largest) + 3:
-                return largest
-    
-    return None
+    # Convert to DataFrame for easier analysis
+    df = pd.DataFrame.from_records(all_results, columns=['filename', 'eps'])
+    return df
+
 def select_final_eps(eps_values):
     """
     Select the final EPS value from all extracted values based on priority rules.
@@ -374,33 +532,38 @@ def select_final_eps(eps_values):
         eps_values: List of dictionaries containing extracted EPS information.
         
     Returns:
-        Single EPS value or None if no valid value found.
+        Single EPS value as a float, or None if no valid value found.
     """
     if not eps_values:
         return None
+    # Lowercase each row text once for both filtering and scoring
+    row_texts_lower = [entry['row_text'].lower() for entry in eps_values]
+
     # Filter out irrelevant entries (e.g., weighted average shares)
-    filtered_values = [
-        entry for entry in eps_values
-        if not re.search(r'shares\s*outstanding', entry['row_text'], re.IGNORECASE)
+    keep = [
+        i for i, text in enumerate(row_texts_lower)
+        if not _SHARES_OUTSTANDING_RE.search(text)
     ]
 
-    if not filtered_values:
+    if not keep:
         return None
 
-    # Sort EPS values by priority (highest first)
-    filtered_values.sort(key=lambda x: get_priority(x), reverse=True)
+    filtered_values = [eps_values[i] for i in keep]
+
+    # Score each entry once; max() keeps the first of any ties
+    priorities = [
+        get_priority(entry, row_texts_lower[i])
+        for entry, i in zip(filtered_values, keep)
+    ]
+    top_idx = max(range(len(priorities)), key=priorities.__getitem__)
 
     # Group values by row text (to handle split values or duplicates)
-    grouped_values = {}
-    for entry in filtered_values:
-        row_text = entry['row_text']
-        if row_text not in grouped_values:
-            grouped_values[row_text] = []
-        grouped_values[row_text].append(entry)
+    top_row_text = filtered_values[top_idx]['row_text']
+    group_idx = [i for i, entry in enumerate(filtered_values) if entry['row_text'] == top_row_text]
 
-    # Select the highest priority group
-    top_group_text = next(iter(grouped_values))  # Get the first group (highest priority)
-    top_group = grouped_values[top_group_text]
+    # Order the highest priority group by priority (highest first)
+    group_idx.sort(key=priorities.__getitem__, reverse=True)
+    top_group = [filtered_values[i] for i in group_idx]
 
     # Check if all values in the group are the same (duplicates)
     unique_values = set(entry['value'] for entry in top_group)
@@ -408,20 +571,22 @@ def select_final_eps(eps_values):
         # If all values are the same, return the first one (no need to sum)
         return top_group[0]['value']
     else:
-        # If values differ, sum them (to handle split values)
-        try:
-            total_value = sum(float(entry['value']) for entry in top_group)
-            # Format the result to match the original precision
-            decimal_places = len(top_group[0]['value'].split('.')[-1]) if '.' in top_group[0]['value'] else 0
-            return f"{total_value:.{decimal_places}f}"
-        except ValueError:
-            # Fallback to the first value if summation fails
-            return top_group[0]['value']
-
-def get_priority(entry):
+        # If values differ, sum them (to handle split values), rounding away
+        # floating point noise from the addition
+        return round(sum(entry['value'] for entry in top_group), 6)
+
+def get_priority(entry, row_text_lower=None):
     """
     Assign a priority score to an EPS entry.
     Higher scores indicate higher priority.
+    
+    Args:
+        entry: Dictionary containing extracted EPS information
+        row_text_lower: Optional lowercased row text, if the caller has
+            already computed it
+        
+    Returns:
+        Integer priority score
     """
     priority = 0
     if entry['basic']:
@@ -430,22 +595,18 @@ def get_priority(entry):
         priority += 50   # GAAP EPS has higher priority
     
     # Add score for specificity of row_text
-    row_text = entry['row_text'].lower()
+    row_text = row_text_lower if row_text_lower is not None else entry['row_text'].lower()
     if "basic" in row_text:
         priority += 30  # Boost for explicit "basic"
     elif "diluted" in row_text:
         priority += 20  # Boost for explicit "diluted"
     
     # Penalty for unrealistic EPS values
-    try:
-        value_float = float(entry['value'])
-        if not (-100 <= value_float <= 100):  # EPS values are typically within this range
-            priority -= 1000  # Large penalty for unrealistic values
-    except ValueError:
-        # Skip if value cannot be converted to float
-        pass
+    if not (-100 <= entry['value'] <= 100):  # EPS values are typically within this range
+        priority -= 1000  # Large penalty for unrealistic values
     
     return priority
+
 if __name__ == "__main__":
     import time
     import argparse